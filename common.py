@@ -1,3 +1,4 @@
+import importlib
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -138,6 +139,31 @@ class Product(ABC):
         """
         log_echo(message, self.log, level, use_tqdm=self._tqdm_echo)
 
+
+@dataclass(frozen=True)
+class _SigmaBackend:
+    plugin_id: str  # pySigma plugin that provides the backend
+    backend_module: str
+    backend_class: str
+    pipeline_module: Optional[str] = None
+    pipeline: Optional[str] = None  # processing pipeline factory passed to the backend, if any
+    supports_json_output: bool = True
+
+
+# sigma backends keyed by product string, 's1_pq' is SentinelOne using PowerQuery
+_SIGMA_BACKENDS: dict[str, _SigmaBackend] = {
+    'cbr': _SigmaBackend('carbonblack', 'sigma.backends.carbonblack', 'CarbonBlackBackend',
+                         'sigma.pipelines.carbonblack', 'CarbonBlackResponse_pipeline'),
+    'cbc': _SigmaBackend('carbonblack', 'sigma.backends.carbonblack', 'CarbonBlackBackend',
+                         'sigma.pipelines.carbonblack', 'CarbonBlack_pipeline'),
+    's1': _SigmaBackend('sentinelone', 'sigma.backends.sentinelone', 'SentinelOneBackend'),
+    's1_pq': _SigmaBackend('sentinelone-pq', 'sigma.backends.sentinelone_pq', 'SentinelOnePQBackend'),
+    'dfe': _SigmaBackend('microsoft365defender', 'sigma.backends.microsoft365defender', 'Microsoft365DefenderBackend',
+                         supports_json_output=False),
+    'cortex': _SigmaBackend('cortexxdr', 'sigma.backends.cortexxdr', 'CortexXDRBackend'),
+}
+
+
 def sigma_translation(product: str, sigma_rules: list, pq: bool = False) -> dict:
     """
     Translates a list of sigma rules into the target product language
@@ -154,8 +180,6 @@ def sigma_translation(product: str, sigma_rules: list, pq: bool = False) -> dict
         If true, translates into PowerQuery syntax
         Otherwise, uses DeepVisibility
     """
-    
-    supports_json_ouput = True
 
     try:
         from sigma.collection import SigmaCollection # type: ignore
@@ -164,34 +188,21 @@ def sigma_translation(product: str, sigma_rules: list, pq: bool = False) -> dict
     except Exception as e:
         raise e
 
-    if product in ('cbr','cbc'):
-        plugins.get_plugin_by_id('carbonblack').install()
-        from sigma.backends.carbonblack import CarbonBlackBackend # type: ignore
-
-        if product == 'cbr':
-            from sigma.pipelines.carbonblack import CarbonBlackResponse_pipeline as cb_pipeline # type: ignore
-        else:
-            from sigma.pipelines.carbonblack import CarbonBlack_pipeline as cb_pipeline # type: ignore
-
-        backend = CarbonBlackBackend(cb_pipeline())
-    elif product == 's1':
-        if pq:
-            plugins.get_plugin_by_id('sentinelone-pq').install()
-            from sigma.backends.sentinelone_pq import SentinelOnePQBackend # type: ignore
-            backend = SentinelOnePQBackend()
-        else:
-            plugins.get_plugin_by_id('sentinelone').install()
-            from sigma.backends.sentinelone import SentinelOneBackend # type: ignore
-            backend = SentinelOneBackend()
-    elif product == 'dfe':
-        supports_json_ouput = False
-        plugins.get_plugin_by_id('microsoft365defender').install()
-        from sigma.backends.microsoft365defender import Microsoft365DefenderBackend # type: ignore
-        backend = Microsoft365DefenderBackend()
-    elif product == 'cortex':
-        plugins.get_plugin_by_id('cortexxdr').install()
-        from sigma.backends.cortexxdr import CortexXDRBackend # type: ignore
-        backend = CortexXDRBackend()
+    backend_key = 's1_pq' if product == 's1' and pq else product
+    if backend_key not in _SIGMA_BACKENDS:
+        raise ValueError(f'Sigma translation is not supported for product {product}')
+
+    spec = _SIGMA_BACKENDS[backend_key]
+    supports_json_ouput = spec.supports_json_output
+
+    plugins.get_plugin_by_id(spec.plugin_id).install()
+    backend_class = getattr(importlib.import_module(spec.backend_module), spec.backend_class)
+
+    if spec.pipeline_module and spec.pipeline:
+        pipeline = getattr(importlib.import_module(spec.pipeline_module), spec.pipeline)
+        backend = backend_class(pipeline())
+    else:
+        backend = backend_class()
 
     are_files = [os.path.isfile(i) for i in sigma_rules]
 
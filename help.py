@@ -1,43 +1,87 @@
 import logging
 import re
+import sys
 from datetime import datetime
+from functools import partial
 
 import click
 # regular expression that detects ANSI color codes
 from tqdm import tqdm
 
-ansi_escape_regex = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])', re.VERBOSE)
+ansi_escape_regex = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_ansi_sub = partial(ansi_escape_regex.sub, '')
+
+_windows = sys.platform.startswith('win')
+_color_prefixes = {
+    logging.WARNING: '\u001b[33m',
+    logging.ERROR: '\u001b[31m',
+}
+_color_reset = '\u001b[0m'
+
+# naive UTC epoch, used as the base for timestamp conversions
+_epoch = datetime(1970, 1, 1)
 
 
 def _strip_ansi_codes(message: str) -> str:
     """
     Strip ANSI sequences from a log string
     """
-    return ansi_escape_regex.sub('', message)
+    # most messages are uncolored, skip the regex entirely when there is no escape character
+    if '\x1b' not in message:
+        return message
+
+    return _ansi_sub(message)
+
+
+def _isatty(stream) -> bool:
+    """
+    Test whether a stream is an interactive terminal. STDOUT may be None (e.g. pythonw) or a
+    file-like object without isatty.
+    """
+    try:
+        return stream.isatty()
+    except Exception:
+        return False
 
 
 def log_echo(message: str, log: logging.Logger, level: int = logging.DEBUG, use_tqdm: bool = False):
     """
     Write a command to STDOUT and the debug log stream.
+
+    Messages below WARNING are skipped entirely when the logger is not enabled for their level.
     """
-    color_message = message
+    if level < logging.WARNING and not log.isEnabledFor(level):
+        return
 
-    if level == logging.WARNING:
-        color_message = f'\u001b[33m{color_message}\u001b[0m'
-    elif level >= logging.ERROR:
-        color_message = f'\u001b[31m{color_message}\u001b[0m'
+    # strip ANSI sequences from log string, and from STDOUT when it is not a terminal
+    plain_message = _strip_ansi_codes(message)
 
-    if use_tqdm:
-        tqdm.write(color_message)
+    stdout = sys.stdout
+
+    # colors are only useful when STDOUT is a terminal, they would be written raw otherwise
+    if _isatty(stdout):
+        # levels above ERROR share its color
+        prefix = _color_prefixes.get(min(level, logging.ERROR))
+        display_message = f'{prefix}{message}{_color_reset}' if prefix else message
     else:
-        click.echo(color_message)
+        display_message = plain_message
+
+    # tqdm.write only needs its lock and bar clearing while a progress bar is active
+    if use_tqdm and getattr(tqdm, '_instances', None):
+        tqdm.write(display_message)
+    elif _windows:
+        # click.echo converts or strips ANSI codes for legacy Windows consoles
+        click.echo(display_message)
+    elif stdout is not None:
+        # flush like click.echo so output stays ordered with STDERR when piped
+        stdout.write(f'{display_message}\n')
+        stdout.flush()
 
-    # strip ANSI sequences from log string
-    log.log(level, _strip_ansi_codes(message))
+    log.log(level, plain_message)
 
 
 def datetime_to_epoch_millis(date: datetime) -> int:
     """
     Convert a datetime object to an epoch timestamp in milliseconds.
     """
-    return int((date - datetime.utcfromtimestamp(0)).total_seconds() * 1000)
\ No newline at end of file
+    return int((date - _epoch).total_seconds() * 1000)
\ No newline at end of file
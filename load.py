@@ -1,12 +1,13 @@
 import os
-from typing import Type, Iterable, Generator, Optional
+from functools import lru_cache
+from typing import Type, Iterable, Generator, Optional, Dict
 
 from common import Product
 
 # import all files in the 'products' folder
 # this is required so that Product.__subclasses__() can resolve all implemented subclasses
 for module in os.listdir(os.path.join(os.path.dirname(__file__), 'products')):
-    if module == '__init__.py' or module[-3:] != '.py':
+    if module == '__init__.py' or not module.endswith('.py'):
         continue
 
     sub_module = module[:-3]
@@ -30,19 +31,29 @@ def _get_subclasses() -> Generator[Type[Product], None, None]:
         yield subclass
 
 
+@lru_cache(maxsize=None)
+def _get_product_classes() -> Dict[Optional[str], Type[Product]]:
+    """
+    Map each product string to its implementation. Product modules are all imported above,
+    so the set of subclasses cannot change and the mapping only needs to be built once.
+    """
+    return {subclass.product: subclass for subclass in _get_subclasses()}
+
+
 def get_product_instance(product: str, **kwargs) -> Product:
     """
     Get an instance of the product implementation matching the specified product string.
     """
-    for subclass in _get_subclasses():
-        if subclass.product == product:
-            return subclass(**kwargs)
+    subclass = _get_product_classes().get(product)
+
+    if subclass is None:
+        raise ValueError(f'Product {product} is not implemented')
 
-    raise ValueError(f'Product {product} is not implemented')
+    return subclass(**kwargs)
 
 
 def get_products() -> Iterable[Optional[str]]:
     """
     Get a list of all implemented product strings.
     """
-    return [subclass.product for subclass in _get_subclasses()] + ['cbr']
+    return list(_get_product_classes()) + ['cbr']
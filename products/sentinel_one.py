@@ -188,6 +188,10 @@ class SentinelOne(Product):
                     if name not in account_names:
                         account_names.append(name.strip())
 
+        # track IDs already collected so membership checks don't rescan the lists
+        known_account_ids = set(self._account_ids)
+        known_site_ids = set(self._site_ids)
+
         # verify provided account IDs are valid
         if account_ids:  
             # create batch of 10 account IDs per call
@@ -208,7 +212,8 @@ class SentinelOne(Product):
                         raise
 
                     for account in response:
-                        if account['id'] not in self._account_ids:
+                        if account['id'] not in known_account_ids:
+                            known_account_ids.add(account['id'])
                             self._account_ids.append(account['id'])
 
                     counter = 0
@@ -233,7 +238,8 @@ class SentinelOne(Product):
 
                 for account in response:
                     temp_account_name.append(account['name'])
-                    if account['id'] not in self._account_ids:
+                    if account['id'] not in known_account_ids:
+                        known_account_ids.add(account['id'])
                         self._account_ids.append(account['id'])
 
             diff = list(set(account_names) - set(temp_account_name))
@@ -266,14 +272,17 @@ class SentinelOne(Product):
                             temp_site_ids.append(site['id'])
  
                             if self._pq:
-                                if site['id'] not in self._site_ids:
+                                if site['id'] not in known_site_ids:
+                                    known_site_ids.add(site['id'])
                                     self._site_ids.append(site['id'])
 
-                                if site['accountId'] not in self._account_ids:
+                                if site['accountId'] not in known_account_ids:
                                     # PowerQuery won't honor Site ID filters unless the parent accousnt ID is also
                                     # included in the request body
+                                    known_account_ids.add(site['accountId'])
                                     self._account_ids.append(site['accountId'])
-                            elif site['accountId'] not in self._account_ids and site['id'] not in self._site_ids:
+                            elif site['accountId'] not in known_account_ids and site['id'] not in known_site_ids:
+                                known_site_ids.add(site['id'])
                                 self._site_ids.append(site['id']) 
 
                     counter = 0
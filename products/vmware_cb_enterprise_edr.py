@@ -53,7 +53,7 @@ class CbEnterpriseEdr(Product):
         self.profile = kwargs['profile'] if 'profile' in kwargs else 'default'
         self.org_key = kwargs['org_key'] if 'org_key' in kwargs else None
         self._device_group = kwargs['device_group'] if 'device_group' in kwargs else None
-        self._device_policy = kwargs['device_policy'] if 'device_group' in kwargs else None
+        self._device_policy = kwargs['device_policy'] if 'device_policy' in kwargs else None
         self._limit = int(kwargs['limit']) if 'limit' in kwargs else self._limit
         self._raw = kwargs['raw'] if 'raw' in kwargs else self._raw
         
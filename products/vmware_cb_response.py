@@ -1,10 +1,19 @@
 import logging
+from typing import Any, Callable
 
 from cbapi.response import CbEnterpriseResponseAPI # type: ignore
 from cbapi.response.models import Process # type: ignore
 
 from common import Product, Tag, Result, Optional
 
+# query fragment for each supported base query filter
+_filter_templates: dict[str, Callable[[Any], str]] = {
+    'days': lambda value: ' start:-%dm' % (value * 1440),
+    'minutes': lambda value: ' start:-%dm' % value,
+    'hostname': lambda value: ' hostname:%s' % value,
+    'username': lambda value: ' username:%s' % value,
+}
+
 
 class CbResponse(Product):
     product: str = 'cbr'
@@ -40,14 +49,8 @@ class CbResponse(Product):
         query_base = ''
 
         for key, value in filters.items():
-            if key == 'days':
-                query_base += ' start:-%dm' % (value * 1440)
-            elif key == 'minutes':
-                query_base += ' start:-%dm' % value
-            elif key == 'hostname':
-                query_base += ' hostname:%s' % value
-            elif key == 'username':
-                query_base += ' username:%s' % value
+            if key in _filter_templates:
+                query_base += _filter_templates[key](value)
             else:
                 self._echo(f'Query filter {key} is not supported by product {self.product}', logging.WARNING)
 
@@ -11,6 +11,7 @@ import datetime
 import json
 import logging
 import os
+from functools import lru_cache
 from typing import Optional, Tuple, Callable, Any
 
 import click
@@ -45,6 +46,9 @@ table_template_str = f'{{:<{table_template[0]}}} ' \
                      f'{{:<{table_template[2]}}} ' \
                      f'{{:<{table_template[3]}}}'
 
+# default result header, shared by all products
+default_header: Tuple[str, ...] = ("endpoint", "username", "process_path", "cmdline", "program", "source")
+
 
 def _write_results(output: Optional[Any], results: list[Result], program: str, source: str,
                    tag: Tag, log: logging.Logger, use_tqdm: bool = False) -> None:
@@ -77,6 +81,78 @@ def _write_results(output: Optional[Any], results: list[Result], program: str, s
             click.echo(table_template_str.format(*row))
 
 
+log_format = '[%(asctime)s] [%(levelname)-8s] [%(name)-36s] [%(filename)-20s:%(lineno)-4s] %(message)s'
+log_formatter = logging.Formatter(log_format)
+
+
+@lru_cache(maxsize=None)
+def _get_log_handler(product_str: str, log_dir: str) -> logging.Handler:
+    """
+    Create the log file handler for a product and logging directory.
+
+    Handlers are cached so that repeated surveys in the same process reuse the open log file
+    instead of creating a new one for every call.
+    """
+    # create logging directory if it does not exist
+    os.makedirs(log_dir, exist_ok=True)
+
+    # create logging file handler
+    log_file_name = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%d%H%M%S') + f'.{product_str}.log'
+    # delay opening the file until the first record is written
+    handler = logging.FileHandler(os.path.join(log_dir, log_file_name), delay=True)
+    handler.setLevel(logging.DEBUG)
+    handler.setFormatter(log_formatter)
+    return handler
+
+
+def _configure_logging(product_str: str, log_dir: str) -> None:
+    """
+    Send all log records to the log file for the current product, replacing any existing root handlers.
+    """
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    root.handlers = [_get_log_handler(product_str, os.path.abspath(log_dir))]
+
+
+def _collect_files(root: str, suffix: str) -> list[str]:
+    """
+    Recursively collect all files under a directory whose name ends with the given suffix.
+
+    Like os.walk, symbolic links to directories are not followed and unreadable directories are skipped.
+    """
+    files = list()
+    pending = [root]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    # as in os.walk, an entry whose type cannot be determined is treated as a file
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        try:
+                            is_symlink = entry.is_symlink()
+                        except OSError:
+                            is_symlink = False
+
+                        if not is_symlink:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        files.append(entry.path)
+        except OSError:
+            continue
+
+    return files
+
+
+# ExecutionOptions fields that are passed through to the product as base query filters
+_BASE_QUERY_FILTERS: Tuple[str, ...] = ('username', 'hostname', 'days', 'minutes')
+
+
 @dataclasses.dataclass
 class ExecutionOptions:
     prefix: Optional[str]
@@ -100,6 +176,24 @@ class ExecutionOptions:
     product_args: dict
 
 
+# checks run against the execution options before a survey starts, paired with the error reported when they fail
+_OPTION_VALIDATIONS: list[Tuple[Callable[[ExecutionOptions], Any], str]] = [
+    (lambda opt: opt.ioc_file and opt.ioc_type is None, '--iocfile requires --ioctype'),
+    (lambda opt: opt.ioc_file and not os.path.isfile(opt.ioc_file), 'Supplied --iocfile is not a file'),
+    (lambda opt: (opt.output or opt.prefix) and opt.no_file, '--output and --prefix cannot be used with --no-file'),
+    (lambda opt: opt.days and opt.minutes, '--days and --minutes are mutually exclusive'),
+    (lambda opt: opt.sigma_rule and not os.path.isfile(opt.sigma_rule), 'Supplied --sigmarule is not a file'),
+    (lambda opt: opt.sigma_dir and not os.path.isdir(opt.sigma_dir), 'Supplied --sigmadir is not a directory'),
+]
+
+
+def _validate_options(opt: ExecutionOptions) -> list[str]:
+    """
+    Run all option validations, returning the error messages for every check that failed.
+    """
+    return [message for check, message in _OPTION_VALIDATIONS if check(opt)]
+
+
 # noinspection SpellCheckingInspection
 @click.group("surveyor", context_settings=CONTEXT_SETTINGS, invoke_without_command=True, chain=False)
 # filtering options
@@ -224,43 +318,16 @@ def survey(ctx, product_str: str = 'cbr') -> None:
     ctx.ensure_object(ExecutionOptions)
     opt: ExecutionOptions = ctx.obj
 
-    if opt.ioc_file and opt.ioc_type is None:
-        ctx.fail("--iocfile requires --ioctype")
-
-    if opt.ioc_file and not os.path.isfile(opt.ioc_file):
-        ctx.fail('Supplied --iocfile is not a file')
-
-    if (opt.output or opt.prefix) and opt.no_file:
-        ctx.fail('--output and --prefix cannot be used with --no-file')
-
-    if opt.days and opt.minutes:
-        ctx.fail('--days and --minutes are mutually exclusive')
-
-    if opt.sigma_rule and not os.path.isfile(opt.sigma_rule):
-        ctx.fail('Supplied --sigmarule is not a file')
+    errors = _validate_options(opt)
+    if errors:
+        ctx.fail('\n'.join(errors))
 
-    if opt.sigma_dir and not os.path.isdir(opt.sigma_dir):
-        ctx.fail('Supplied --sigmadir is not a directory')
+    # configure logging
+    _configure_logging(product_str, opt.log_dir)
 
     # instantiate a logger
     log = logging.getLogger('surveyor')
-    logging.debug(f'Product: {product_str}')
-
-    # configure logging
-    root = logging.getLogger()
-    root.setLevel(logging.DEBUG)
-    root.handlers = list()  # remove all default handlers
-    log_format = '[%(asctime)s] [%(levelname)-8s] [%(name)-36s] [%(filename)-20s:%(lineno)-4s] %(message)s'
-
-    # create logging directory if it does not exist
-    os.makedirs(opt.log_dir, exist_ok=True)
-
-    # create logging file handler
-    log_file_name = datetime.datetime.utcnow().strftime('%Y%m%d%H%M%S') + f'.{product_str}.log'
-    handler = logging.FileHandler(os.path.join(opt.log_dir, log_file_name))
-    handler.setLevel(logging.DEBUG)
-    handler.setFormatter(logging.Formatter(log_format))
-    root.addHandler(handler)
+    log.debug(f'Product: {product_str}')
 
     # build arguments required for product class
     # must products only require the profile name
@@ -268,8 +335,8 @@ def survey(ctx, product_str: str = 'cbr') -> None:
         'profile': opt.profile
     }
 
-    if len(opt.product_args) > 0:
-        kwargs.update(opt.product_args)
+    # unset product arguments are left out so products fall back to their own defaults
+    kwargs.update((k, v) for k, v in opt.product_args.items() if v is not None)
 
     if opt.limit:
         kwargs['limit'] = str(opt.limit)
@@ -295,20 +362,13 @@ def survey(ctx, product_str: str = 'cbr') -> None:
     sigma_rules = list()
 
     # add filters specified by user
-    if opt.username is not None:
-        base_query.update({"username": opt.username})
-
-    if opt.hostname is not None:
-        base_query.update({"hostname": opt.hostname})
-
-    if opt.days is not None:
-        base_query.update({"days": opt.days})
-
-    if opt.minutes is not None:
-        base_query.update({"minutes": opt.minutes})
+    for key in _BASE_QUERY_FILTERS:
+        value = getattr(opt, key)
+        if value is not None:
+            base_query[key] = value
 
-    # default header, shared by all products
-    header = ["endpoint", "username", "process_path", "cmdline", "program", "source"]
+    # start from a copy of the default header
+    header = list(default_header)
 
     # add any additional rows that the current product includes to header
     header.extend(product.get_other_row_headers())
@@ -333,9 +393,7 @@ def survey(ctx, product_str: str = 'cbr') -> None:
         output_file = None
         writer = None
         opt.no_progress = True
-        template_str = f'{{:<{table_template[0]}}} {{:<{table_template[1]}}} {{:<{table_template[2]}}} ' \
-                       f'{{:<{table_template[3]}}}'
-        click.echo(template_str.format(*header))
+        click.echo(table_template_str.format(*header))
 
     try:
         if opt.query:
@@ -370,26 +428,20 @@ def survey(ctx, product_str: str = 'cbr') -> None:
             if not os.path.exists(opt.def_dir):
                 ctx.fail("The defdir doesn't exist. Please try again.")
             else:
-                for root_dir, dirs, files in os.walk(opt.def_dir):
-                    for filename in files:
-                        if os.path.splitext(filename)[1] == '.json':
-                            definition_files.append(os.path.join(root_dir, filename))
+                definition_files.extend(_collect_files(opt.def_dir, '.json'))
 
         # if --sigma_dir, add all files to sigma_rules list
         if opt.sigma_dir:
-            for root_dir, dirs, files in os.walk(opt.sigma_dir):
-                for filename in files:
-                    if os.path.splitext(filename)[1] == '.yml':
-                        sigma_rules.append(os.path.join(root_dir, filename))
+            sigma_rules.extend(_collect_files(opt.sigma_dir, '.yml'))
 
         # run search based on IOC file
         if opt.ioc_file:
             with open(opt.ioc_file) as ioc_file:
                 basename = os.path.basename(opt.ioc_file)
-                data = ioc_file.readlines()
                 log_echo(f"Processing IOC file: {opt.ioc_file}", log)
 
-                ioc_list = [x.strip() for x in data]
+                # stream the file line by line, dropping surrounding whitespace and blank lines
+                ioc_list = list(filter(None, map(str.strip, ioc_file)))
 
                 product.nested_process_search(Tag(f"IOC - {opt.ioc_file}", data=basename), {opt.ioc_type: ioc_list}, base_query)
 
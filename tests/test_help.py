@@ -0,0 +1,73 @@
+import pytest
+import sys
+import os
+import logging
+sys.path.append(os.getcwd())
+from help import log_echo
+
+
+@pytest.fixture
+def logger():
+    log = logging.getLogger('surveyor.test_help')
+    yield log
+    log.setLevel(logging.NOTSET)
+
+
+def test_log_echo_disabled_level(logger, capsys, caplog):
+    """
+    Verify a DEBUG message is neither printed nor logged when the logger is not enabled for DEBUG
+    """
+    logger.setLevel(logging.INFO)
+    with caplog.at_level(logging.DEBUG):
+        log_echo('debug message', logger, logging.DEBUG)
+
+    assert capsys.readouterr().out == ''
+    assert not [record for record in caplog.records if record.name == logger.name]
+
+
+@pytest.mark.parametrize('level', [logging.WARNING, logging.ERROR])
+def test_log_echo_warning_and_error_always_print(logger, capsys, level):
+    """
+    Verify WARNING and ERROR messages are printed even when the logger is not enabled for them
+    """
+    logger.setLevel(logging.CRITICAL)
+    log_echo('important message', logger, level)
+
+    assert 'important message' in capsys.readouterr().out
+
+
+def test_log_echo_enabled_level(logger, capsys, caplog):
+    """
+    Verify a DEBUG message is printed and logged when the logger is enabled for DEBUG
+    """
+    logger.setLevel(logging.DEBUG)
+    with caplog.at_level(logging.DEBUG):
+        log_echo('\u001b[92mdebug message\u001b[0m', logger, logging.DEBUG)
+
+    assert capsys.readouterr().out == 'debug message\n'
+    assert [record.getMessage() for record in caplog.records if record.name == logger.name] == ['debug message']
+
+
+def test_log_echo_tqdm_without_active_bar(logger, capsys, mocker):
+    """
+    Verify use_tqdm writes straight to STDOUT when no progress bar is active
+    """
+    mocker.patch('help.tqdm._instances', set())
+    mocked_write = mocker.patch('help.tqdm.write')
+    logger.setLevel(logging.DEBUG)
+    log_echo('no bar message', logger, use_tqdm=True)
+
+    mocked_write.assert_not_called()
+    assert capsys.readouterr().out == 'no bar message\n'
+
+
+def test_log_echo_tqdm_with_active_bar(logger, mocker):
+    """
+    Verify use_tqdm writes through tqdm while a progress bar is active
+    """
+    mocker.patch('help.tqdm._instances', {mocker.Mock()})
+    mocked_write = mocker.patch('help.tqdm.write')
+    logger.setLevel(logging.DEBUG)
+    log_echo('bar message', logger, use_tqdm=True)
+
+    mocked_write.assert_called_once_with('bar message')
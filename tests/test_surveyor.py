@@ -1,6 +1,7 @@
 import pytest
 import sys
 import os
+import logging
 from click.testing import CliRunner
 sys.path.append(os.getcwd())
 from surveyor import cli
@@ -80,6 +81,21 @@ def test_custom_query(runner, mocker):
     mocked_process_search.assert_called_once_with(Tag('query'), {}, 'SELECT * FROM processes')
 
 
+def test_log_handler_reused(runner, mocker):
+    """
+    Verify repeated surveys with the same product and log directory reuse a single log file handler
+    """
+    mocker.patch('products.vmware_cb_response.CbResponse._authenticate')
+    mocker.patch('products.vmware_cb_response.CbResponse.process_search')
+    with runner.isolated_filesystem():
+        runner.invoke(cli, ["--query", "SELECT * FROM processes", "--no-file"])
+        first_handlers = list(logging.getLogger().handlers)
+        runner.invoke(cli, ["--query", "SELECT * FROM processes", "--no-file"])
+        assert len(first_handlers) == 1
+        assert logging.getLogger().handlers == first_handlers
+        assert len(os.listdir('logs')) == 1
+
+
 def test_def_file(runner, mocker):
     """
     Verify when a definition file is passed, it is logged and an EDR product is called
@@ -154,6 +170,31 @@ def test_def_dir_with_base_query(runner, mocker):
         mocked_nested_process_search.assert_has_calls(expected_calls, any_order=True)
 
 
+def test_def_dir_nested(runner, mocker):
+    """
+    Verify definition files in subdirectories are processed and files without a .json extension are ignored
+    """
+    mocker.patch('products.vmware_cb_response.CbResponse._authenticate')
+    mocked_nested_process_search = mocker.patch('products.vmware_cb_response.CbResponse.nested_process_search')
+    with runner.isolated_filesystem() as temp_dir:
+        os.makedirs(os.path.join(temp_dir, "nested"))
+        def_file_path1 = os.path.join(temp_dir, "test_deffile1.json")
+        def_file_path2 = os.path.join(temp_dir, "nested", "test_deffile2.json")
+        with open(def_file_path1, 'w') as deffile:
+            deffile.write("""{"ProgramA":{"process_name":["test1.exe"]}}""")
+        with open(def_file_path2, 'w') as deffile:
+            deffile.write("""{"ProgramB":{"process_name":["test2.exe"]}}""")
+        with open(os.path.join(temp_dir, "nested", "notes.txt"), 'w') as deffile:
+            deffile.write("""{"ProgramC":{"process_name":["test3.exe"]}}""")
+
+        expected_calls = [mocker.call(Tag('ProgramA', 'test_deffile1'),{"process_name":["test1.exe"]}, {}),
+                          mocker.call(Tag('ProgramB', 'test_deffile2'),{"process_name":["test2.exe"]}, {})]
+        result = runner.invoke(cli, ["--defdir", temp_dir])
+        assert "Processing definition files:" in result.output
+        mocked_nested_process_search.assert_has_calls(expected_calls, any_order=True)
+        assert mocked_nested_process_search.call_count == 2
+
+
 def test_invalid_def_file(runner, mocker):
     """
     Verify if a non-existent definition file is passed, it is logged and nothing is passed to the EDR product
@@ -181,6 +222,29 @@ def test_invalid_sigma_dir(runner, mocker):
     mocked_nested_process_search.assert_not_called()
 
 
+def test_multiple_invalid_options(runner, mocker):
+    """
+    Verify every failed option validation is reported, not just the first
+    """
+    mocked_func = mocker.patch('products.vmware_cb_response.CbResponse._authenticate')
+    result = runner.invoke(cli, ["--days", "1", "--minutes", "5", "--sigmarule", "nonexistent.yml"])
+    assert "--days and --minutes are mutually exclusive" in result.output
+    assert "Supplied --sigmarule is not a file" in result.output
+    assert result.exit_code != 0
+    mocked_func.assert_not_called()
+
+
+def test_invalid_options_create_no_log_file(runner, mocker):
+    """
+    Verify no log file is created when option validation fails
+    """
+    mocker.patch('products.vmware_cb_response.CbResponse._authenticate')
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli, ["--days", "1", "--minutes", "5"])
+        assert result.exit_code != 0
+        assert not os.path.exists('logs')
+
+
 def test_ioc_file(runner, mocker):
     """
     Verify if an IOC file is passed, it is logged and an EDR product is called
@@ -214,6 +278,20 @@ def test_ioc_file_with_base_query(runner, mocker):
         mocked_nested_process_search.assert_called_once_with(Tag(f'IOC - {ioc_file_path}', 'ioc_list.txt'), {'ipaddr':['127.0.0.1']}, {'days':5, 'hostname':'workstation1', 'username':'admin'})
 
 
+def test_ioc_file_blank_lines(runner, mocker):
+    """
+    Verify IOCs are stripped of surrounding whitespace and blank lines are skipped
+    """
+    mocker.patch('products.vmware_cb_response.CbResponse._authenticate')
+    mocked_nested_process_search = mocker.patch('products.vmware_cb_response.CbResponse.nested_process_search')
+    with runner.isolated_filesystem() as temp_dir:
+        ioc_file_path = os.path.join(temp_dir, "ioc_list.txt")
+        with open(ioc_file_path, 'w') as deffile:
+            deffile.write("127.0.0.1\n\n  10.0.0.1  \n\n")
+        runner.invoke(cli, ["--iocfile", ioc_file_path, "--ioctype", "ipaddr"])
+        mocked_nested_process_search.assert_called_once_with(Tag(f'IOC - {ioc_file_path}', 'ioc_list.txt'), {'ipaddr':['127.0.0.1', '10.0.0.1']}, {})
+
+
 def test_no_argument_provided(runner):
     arguments = ["--deffile", "--profile", "--prefix", "--output", "--defdir", "--iocfile", "--ioctype", "--query", "--hostname", "--days", "--minutes", "--username", "--limit"]
 
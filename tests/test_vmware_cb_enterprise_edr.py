@@ -166,4 +166,12 @@ def mocked_query_return(full_query: str):
         MockProcResult(),
         MockProcResult(),
         MockProcResult()
-    ]
\ No newline at end of file
+    ]
+
+
+def test_device_policy_without_device_group(mocker):
+    mocker.patch.object(CbEnterpriseEdr, '_authenticate')
+    cbc_product = CbEnterpriseEdr(profile='default', device_policy=['strict'])
+
+    assert cbc_product._device_group is None
+    assert cbc_product._device_policy == ['strict']